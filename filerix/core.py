@@ -1,11 +1,13 @@
 from filerix.exceptions import PathValidationError
 from filerix.utils import (
     _validate_path, _ensure_directory,
-    _sanitize_content
+    _sanitize_content, _read_bytes, _read_text,
+    _write_bytes
 )
 
 from typing import Union, Optional 
 from pathlib import Path 
+import os
 
 def create_file(path: Union[str, Path], content: Optional[Union[str, bytes, dict, list, int, float, bool]] = '', *, overwrite: bool = True, compact: bool = False, encoding: str = 'utf-8') -> Path:
     """
@@ -24,37 +26,49 @@ def create_file(path: Union[str, Path], content: Optional[Union[str, bytes, dict
     Raises: 
         PathValidationError: Em caso de erros de validação, escrita ou permissões.
         TypeError: Se o conteúdo for de tipo não suportado.
-        ValueError: Se o conteúdo sanitizado for inválido.
+        ValueError: Se o conteúdo sanitizado for inválido (ou não puder ser codificado).
+        LookupError: Se a codificação for desconhecida.
     """
     
+    # Texto do caminho usado nas mensagens de erro, calculado uma única vez
+    spath = path if isinstance(path, str) else str(path)
+
     try:
         # Garante que o path é um objeto Path válido 
         path = Path(path).expanduser().resolve(strict = False)
+        spath = str(path)
 
-        # Evita sobrescrita indesejada 
-        if path.exists() and not overwrite:
-            raise PathValidationError(str(path), 'O arquivo já existe e sobrescrita não é permitida.')
-
-        # Garante que o diretório pai existe 
-        _ensure_directory(path.parent)
-        
         # Sanitiza o conteúdo (opcionalmente compacto)
         safe_content = _sanitize_content(content, compact = compact)
 
-        # Escreve o conteúdo no arquivo (UTF-8 ou outro)
-        path.write_text(safe_content, encoding = encoding)
+        # Mesma tradução de quebras de linha do modo texto (ex: \r\n no Windows)
+        if os.linesep != '\n':
+            safe_content = safe_content.replace('\n', os.linesep)
+
+        # Codifica tudo de uma vez antes de tocar no disco: uma falha de
+        # codificação não cria diretórios nem mexe no arquivo existente
+        payload = safe_content.encode(encoding, errors = 'strict')
+
+        # Garante que o diretório pai existe 
+        _ensure_directory(path.parent, _assume_absolute = True)
+
+        # Escreve o conteúdo no arquivo (UTF-8 ou outro). Com overwrite=False
+        # o O_EXCL evita sobrescrita de forma atômica (sem corrida com exists())
+        _write_bytes(path, payload, exclusive = not overwrite)
 
         return path 
-    except (TypeError, ValueError) as error:
-        raise error # Erros da função _sanitize_content()
+    except (TypeError, ValueError):
+        raise # Erros da função _sanitize_content() e da codificação
     except PathValidationError:
         raise 
+    except FileExistsError:
+        raise PathValidationError(spath, 'O arquivo já existe e sobrescrita não é permitida.')
     except PermissionError:
-        raise PathValidationError(str(path), 'Permissão negada para criar o arquivo.')
+        raise PathValidationError(spath, 'Permissão negada para criar o arquivo.')
     except IsADirectoryError:
-        raise PathValidationError(str(path), 'O caminho especificado é um diretório.')
-    except Exception as error:
-        raise PathValidationError(str(path), f'Erro desconhecido ao criar o arquivo: {error}')
+        raise PathValidationError(spath, 'O caminho especificado é um diretório.')
+    except OSError as error:
+        raise PathValidationError(spath, f'Erro ao criar o arquivo: {error}')
 
 def read_file(path: Union[str, Path], *, as_bytes: bool = False, encoding: str = 'utf-8') -> Union[str, bytes]:
     """
@@ -70,26 +84,28 @@ def read_file(path: Union[str, Path], *, as_bytes: bool = False, encoding: str =
     
     Raises:
         PathValidationError: Se o caminho for inválido ou não for arquivo.
+        TypeError: Se o caminho não for string ou Path.
         FileNotFoundError: Se o arquivo não existir.
         UnicodeDecodeError: Se falhar ao decodificar com a codificação dada.
+        LookupError: Se a codificação for desconhecida.
         PermissionError: Se não for possível ler o arquivo. 
     """
 
+    spath = path if isinstance(path, str) else str(path)
+
     try:
         file_path = _validate_path(path, must_exist = True, is_file = True, readable = True)
         if as_bytes:
-            return file_path.read_bytes()
-        return file_path.read_text(encoding = encoding)
+            return _read_bytes(file_path)
+        return _read_text(file_path, encoding = encoding)
     except FileNotFoundError:
-        raise FileNotFoundError(f'Arquivo não encontrado: {path}')
+        raise FileNotFoundError(f'Arquivo não encontrado: {spath}')
     except PermissionError:
-        raise PathValidationError(str(path), 'Sem permissão para leitura do arquivo')
-    except UnicodeDecodeError:
-        raise UnicodeDecodeError('Falha ao decodificar o conteúdo com a codificação passada')
+        raise PathValidationError(spath, 'Sem permissão para leitura do arquivo')
     except PathValidationError:
         raise 
-    except Exception as error:
-        raise PathValidationError(str(path), f'Erro ao ler o arquivo: {error}')
+    except OSError as error:
+        raise PathValidationError(spath, f'Erro ao ler o arquivo: {error}')
 
 def delete_file(path: Union[str, Path], *, ignore_missing: bool = False) -> bool:
     """
@@ -104,28 +120,32 @@ def delete_file(path: Union[str, Path], *, ignore_missing: bool = False) -> bool
     
     Raises:
         PathValidationError: Se o caminho for inválido ou não for um arquivo.
+        TypeError: Se o caminho não for string ou Path.
         PermissionError: Se não houver permissão para deletar.
         FileNotFoundError: Se o arquivo não existir (ignore_missing=False).
     """
 
+    spath = path if isinstance(path, str) else str(path)
+
     try:
         path = Path(path).expanduser().resolve(strict = False)
+        spath = str(path)
         
         # Verificação de existência antecipada se for ignorar 
         if not path.exists():
             if ignore_missing:
                 return False 
-            raise PathValidationError(str(path), 'O caminho não existe')
+            raise PathValidationError(spath, 'O caminho não existe')
         
         # Agora sim passa pela validação 
-        _validate_path(path, must_exist = True, is_file = True)
+        _validate_path(path, must_exist = True, is_file = True, _assume_absolute = True)
         path.unlink() 
         return True
     except IsADirectoryError:
-        raise PathValidationError(str(path), 'O caminho especificado é um diretório')
+        raise PathValidationError(spath, 'O caminho especificado é um diretório')
     except PermissionError:
-        raise PathValidationError(str(path), 'Sem permissão para deletar o arquivo')
+        raise PathValidationError(spath, 'Sem permissão para deletar o arquivo')
     except PathValidationError:
         raise 
-    except Exception as error:
-        raise PathValidationError(str(path), f'Erro ao deletar o arquivo: {error}')
+    except OSError as error:
+        raise PathValidationError(spath, f'Erro ao deletar o arquivo: {error}')
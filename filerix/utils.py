@@ -1,10 +1,240 @@
 from filerix.exceptions import PathValidationError
-from typing import Union, Optional, Any
+from typing import Union, Optional, Any, Tuple
 import tempfile, ctypes, json 
-import stat, os, sys, re
+import stat, os, sys, re, errno
 from pathlib import Path 
 import unicodedata
 
+try:
+    import orjson # Opcional: serialização JSON mais rápida
+except ImportError:
+    orjson = None
+
+_IS_WIN = sys.platform == 'win32'
+
+# Atributos de arquivo do Windows (GetFileAttributesW)
+_FILE_ATTRIBUTE_READONLY = 0x01
+_FILE_ATTRIBUTE_HIDDEN = 0x02
+_INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+if _IS_WIN:
+    # Protótipo próprio, resolvido uma única vez, sem alterar ctypes.windll.kernel32
+    _GetFileAttributesW = ctypes.WINFUNCTYPE(ctypes.c_uint32, ctypes.c_wchar_p)(
+        ('GetFileAttributesW', ctypes.windll.kernel32)
+    )
+
+# Padrões pré-compilados usados em _sanitize_content(). Só casam trechos que
+# realmente mudam (um espaço simples já está no formato final), então um
+# conteúdo já compacto não gera nenhuma substituição nem nova string.
+_MULTI_NL_RE = re.compile(r'\n{2,}')
+_MULTI_WS_RE = re.compile(r'[ \t]{2,}|\t')
+
+# Faixas de codepoints que ficam em cache na _STRIP_TABLE: todo o BMP (inclui
+# CJK, kana e Hangul) e o bloco de símbolos/emoji do plano 1. O tamanho fica
+# limitado a _STRIP_CACHE_MAX entradas (~5 MB); os planos astrais restantes,
+# raros na prática, são classificados a cada ocorrência
+_STRIP_CACHE_BMP_END = 0x10000
+_STRIP_CACHE_EMOJI = range(0x1F000, 0x20000)
+_STRIP_CACHE_MAX = _STRIP_CACHE_BMP_END + len(_STRIP_CACHE_EMOJI)
+
+class _StripTable(dict):
+    """
+    Tabela de tradução para str.translate() que remove caracteres de controle
+    (categoria Unicode 'C*'), exceto \\t e \\n, e converte \\r em \\n.
+
+    Codepoints do BMP e do bloco de emoji são classificados uma única vez e o
+    resultado fica em cache no próprio dicionário, então as próximas consultas
+    são feitas em C. Os demais são classificados a cada ocorrência, sem cache.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        if char == '\n' or char == '\t' or not unicodedata.category(char).startswith('C'):
+            result = codepoint
+        else:
+            result = None
+
+        if codepoint < _STRIP_CACHE_BMP_END or codepoint in _STRIP_CACHE_EMOJI:
+            self[codepoint] = result
+        return result
+
+_STRIP_TABLE = _StripTable({ord('\r'): ord('\n')})
+
+# Caracteres ASCII que a _STRIP_TABLE altera (controle, incluindo \r, e DEL)
+_ASCII_CONTROL_CHARS = tuple(chr(c) for c in (*range(0x00, 0x09), *range(0x0B, 0x20), 0x7F))
+
+# A partir deste tamanho, procurar esses caracteres (busca em C, sem alocar)
+# sai mais barato que o str.translate() completo
+_ASCII_FAST_PATH_MIN = 1024
+
+def _is_clean_ascii(content_str: str) -> bool:
+    """
+    Indica se o texto é ASCII e não tem nada para a _STRIP_TABLE alterar.
+
+    Args:
+        content_str (str): Texto a ser verificado.
+
+    Returns:
+        bool: True se o texto pode pular a remoção de caracteres de controle.
+    """
+
+    # str.isascii() é O(1) no CPython (flag da string compacta)
+    if len(content_str) < _ASCII_FAST_PATH_MIN or not content_str.isascii():
+        return False
+    return not any(ch in content_str for ch in _ASCII_CONTROL_CHARS)
+
+# Encoders reutilizados: json.dumps() com argumentos não-padrão cria um
+# JSONEncoder novo a cada chamada
+_JSON_PRETTY_ENCODER = json.JSONEncoder(ensure_ascii = False, indent = 2)
+_JSON_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii = False, separators = (',', ':'))
+
+# Tipos escalares que o orjson serializa exatamente como o json padrão
+_ORJSON_SAFE_SCALARS = frozenset((str, int, bool, type(None)))
+
+if orjson is not None:
+    # Tipos extras do orjson (datetime, dataclass, subclasses) levantam TypeError,
+    # como no json padrão, e caem no fallback
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS |
+        orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+def _is_orjson_safe(content: Union[dict, list]) -> bool:
+    """
+    Indica se o orjson gera para a estrutura a mesma saída que o json padrão.
+
+    Só aceita dict (com chaves str), list e escalares simples, sem containers
+    repetidos (evita ciclos). Floats precisam ser finitos (o orjson escreve
+    NaN/Infinity como null) e estar fora da faixa em que repr() usa notação
+    científica (o formato do expoente difere).
+
+    Args:
+        content (Union[dict, list]): Estrutura a ser verificada.
+
+    Returns:
+        bool: True se a estrutura pode ser serializada com orjson.
+    """
+
+    stack = [content]
+    seen = set()
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is dict or item_type is list:
+            # Container repetido (ex: referência circular) fica com o json padrão,
+            # que detecta o ciclo; sem isso o laço nunca terminaria
+            if id(item) in seen:
+                return False
+            seen.add(id(item))
+
+        if item_type is dict:
+            for key in item:
+                if type(key) is not str:
+                    return False
+            stack.extend(item.values())
+        elif item_type is list:
+            stack.extend(item)
+        elif item_type is float:
+            # NaN falha nas duas comparações; inf falha no limite superior
+            if not (item == 0 or 1e-4 <= abs(item) < 1e16):
+                return False
+        elif item_type not in _ORJSON_SAFE_SCALARS:
+            return False
+    return True
+
+def _dump_json(content: Union[dict, list], *, compact: bool = False) -> str:
+    """
+    Serializa uma estrutura JSON, usando orjson quando estiver instalado e a
+    saída for idêntica à do json padrão.
+
+    Args:
+        content (Union[dict, list]): Estrutura a ser serializada.
+        compact (bool): Se True, gera JSON sem indentação nem espaços.
+
+    Returns:
+        str: JSON serializado.
+    """
+
+    if orjson is not None and _is_orjson_safe(content):
+        option = _ORJSON_OPTIONS if compact else _ORJSON_OPTIONS | orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(content, option = option).decode('utf-8')
+        except TypeError:
+            pass # Ex: inteiros > 64 bits, que o json padrão aceita
+
+    return (_JSON_COMPACT_ENCODER if compact else _JSON_PRETTY_ENCODER).encode(content)
+
+def _json_to_str(content: Union[dict, list], compact: bool) -> str:
+    """
+    Converte uma estrutura JSON (dict ou list) em string.
+
+    Args:
+        content (Union[dict, list]): Estrutura a ser convertida.
+        compact (bool): Se True, gera JSON sem indentação nem espaços.
+
+    Returns:
+        str: JSON serializado.
+
+    Raises:
+        TypeError: Se a estrutura não puder ser serializada.
+    """
+
+    try:
+        return _dump_json(content, compact = compact)
+    except Exception as error:
+        raise TypeError(f'Falha ao converter estrutura JSON: {error}')
+
+def _scalar_to_str(content: Union[str, int, float, bool, None], compact: bool) -> str:
+    """
+    Converte um valor escalar (str, int, float, bool ou None) em string.
+
+    Args:
+        content (Union[str, int, float, bool, None]): Valor a ser convertido.
+        compact (bool): Não usado; mantém a assinatura comum dos conversores.
+
+    Returns:
+        str: Resultado de str(content).
+    """
+
+    return str(content)
+
+def _bytes_to_str(content: bytes, compact: bool) -> str:
+    """
+    Decodifica bytes UTF-8 em string.
+
+    O decodificador UTF-8 do CPython valida e decodifica na mesma passada
+    (com atalho para ASCII); validar antes com outra biblioteca seria uma
+    passada extra sobre os mesmos bytes.
+
+    Args:
+        content (bytes): Bytes a serem decodificados.
+        compact (bool): Não usado; mantém a assinatura comum dos conversores.
+
+    Returns:
+        str: Texto decodificado.
+
+    Raises:
+        TypeError: Se os bytes não forem UTF-8 válido.
+    """
+
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        raise TypeError('Bytes devem estar codificados em UTF-8')
+
+# Conversores de conteúdo indexados pelo tipo exato (consulta O(1) em vez de
+# uma cadeia de isinstance). A ordem também é usada no fallback por subclasse.
+_CONTENT_HANDLERS = {
+    dict: _json_to_str,
+    list: _json_to_str,
+    str: _scalar_to_str,
+    int: _scalar_to_str,
+    float: _scalar_to_str,
+    bool: _scalar_to_str,
+    type(None): _scalar_to_str,
+    bytes: _bytes_to_str,
+}
+
 def _sanitize_content(content: Any, *, compact: bool = False) -> str:
     """
     Limpa e padroniza o conteúdo a ser escrito em um arquivo. 
@@ -22,46 +252,196 @@ def _sanitize_content(content: Any, *, compact: bool = False) -> str:
     """
 
     # Converter o conteúdo para uma string segura 
-    if isinstance(content, (dict, list)):
-        try:
-            content_str = json.dumps(content, ensure_ascii = False, indent = None if compact else 2)
-        except Exception as error:
-            raise TypeError(f'Falha ao converter estrutura JSON: {error}')
-    elif isinstance(content, (str, int, float, bool, type(None))):
-        content_str = str(content)
-    elif isinstance(content, bytes):
-        try:
-            content_str = content.decode('utf-8')
-        except UnicodeDecodeError:
-            raise TypeError('Bytes devem estar codificados em UTF-8')
-    else:
-        raise TypeError(f'Tipo de conteúdo não suportado: {type(content)}')
-
-    # Remover caracteres de controle invisíveis (exceto \t e \n)
-    content_str = ''.join(
-        ch for ch in content_str
-        if (ch == '\n' or ch == '\t' or not unicodedata.category(ch).startswith('C'))
-    )
-
-    # Padronizar as quebras de linha 
-    content_str = content_str.replace('\r\n', '\n').replace('\r', '\n')
+    handler = _CONTENT_HANDLERS.get(type(content))
+    if handler is None:
+        # Subclasses (ex: OrderedDict, IntEnum) caem na verificação por isinstance
+        for base, base_handler in _CONTENT_HANDLERS.items():
+            if isinstance(content, base):
+                handler = base_handler
+                break
+        else:
+            raise TypeError(f'Tipo de conteúdo não suportado: {type(content)}')
+
+    content_str = handler(content, compact)
+
+    # Texto ASCII já limpo (caso mais comum) não precisa de mais nenhuma passada
+    if not _is_clean_ascii(content_str):
+        # Padronizar as quebras de linha (\r isolado é tratado na tabela abaixo)
+        if '\r' in content_str:
+            content_str = content_str.replace('\r\n', '\n')
+
+        # Remover caracteres de controle invisíveis (exceto \t e \n) e converter \r em \n
+        content_str = content_str.translate(_STRIP_TABLE)
 
     if compact:
         # Remove quebras múltiplas e espaços duplicados 
-        content_str = re.sub(r'\n{2,}', '\n', content_str)
-        content_str = re.sub(r'[ \t]+', ' ', content_str).strip()
+        content_str = _MULTI_NL_RE.sub('\n', content_str)
+        content_str = _MULTI_WS_RE.sub(' ', content_str).strip()
 
-    if not content_str.strip():
+    # Mesmo critério de `not content_str.strip()`, sem copiar a string inteira
+    if not content_str or content_str.isspace():
         raise ValueError('O conteúdo final está vazio após a sanitização')
 
     return content_str
 
-def _is_readonly(path: Union[str, Path]) -> bool:
+def _normalize_path(path: Union[str, Path]) -> Path:
+    """
+    Expande '~' e converte o caminho para absoluto, sem acessar o disco
+    quando possível.
+
+    Caminhos sem '..' não passam por Path.resolve() (que faz um stat() por
+    componente). Com '..', o resolve() é mantido: colapsar o '..' como texto
+    ignoraria links simbólicos e poderia apontar para outro arquivo.
+
+    Args:
+        path (Union[str, Path]): Caminho a ser normalizado.
+
+    Returns:
+        Path: Caminho absoluto.
+    """
+
+    path = Path(path).expanduser()
+    if '..' in path.parts:
+        return path.resolve()
+    return path if path.is_absolute() else Path.cwd() / path
+
+# Erros de stat() que significam apenas "não existe" (mesmo critério do pathlib)
+_MISSING_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """
+    Executa um único os.stat() no caminho, seguindo links simbólicos.
+
+    Args:
+        path (Path): Caminho a ser consultado.
+
+    Returns:
+        Optional[os.stat_result]: Resultado do stat, ou None se o caminho não existir.
+    """
+
+    try:
+        return os.stat(path)
+    except OSError as error:
+        if error.errno in _MISSING_ERRNOS:
+            return None
+        raise
+    except ValueError:
+        return None
+
+# Tamanho dos blocos lidos após o tamanho informado pelo fstat()
+_READ_CHUNK_SIZE = 64 * 1024
+
+def _read_bytes(path: Path) -> bytes:
+    """
+    Lê o arquivo inteiro como bytes direto do descritor, sem BufferedReader.
+
+    Args:
+        path (Path): Caminho do arquivo.
+
+    Returns:
+        bytes: Conteúdo completo do arquivo.
+    """
+
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        # Tenta ler tudo de uma vez e continua até o EOF (arquivo pode ter crescido)
+        size = os.fstat(fd).st_size
+        to_read = size if size > 0 else _READ_CHUNK_SIZE
+        chunks = []
+        while True:
+            chunk = os.read(fd, to_read)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            to_read = _READ_CHUNK_SIZE
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+def _read_text(path: Path, encoding: str = 'utf-8') -> str:
+    """
+    Lê o arquivo inteiro como texto, com a mesma normalização de quebras de
+    linha que Path.read_text() (\\r\\n e \\r viram \\n).
+
+    Args:
+        path (Path): Caminho do arquivo.
+        encoding (str): Codificação usada na decodificação.
+
+    Returns:
+        str: Conteúdo decodificado do arquivo.
+    """
+
+    text = _read_bytes(path).decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+# Tamanho máximo de cada os.write() em _write_bytes()
+_WRITE_CHUNK_SIZE = 1024 * 1024
+
+def _write_bytes(path: Path, data: bytes, *, exclusive: bool = False) -> None:
+    """
+    Escreve bytes no arquivo direto no descritor, sem camada de buffer.
+
+    O arquivo é criado se não existir e truncado se existir. Conteúdos de até
+    1 MiB são escritos com uma única chamada a os.write().
+
+    Args:
+        path (Path): Caminho do arquivo.
+        data (bytes): Conteúdo a ser escrito.
+        exclusive (bool): Se True, falha caso o arquivo já exista (O_EXCL),
+                          de forma atômica.
+
+    Raises:
+        FileExistsError: Se exclusive=True e o arquivo já existir.
+    """
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    if exclusive:
+        flags |= os.O_EXCL
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view[:_WRITE_CHUNK_SIZE])
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def _existing_path(path: Union[str, Path]) -> Tuple[Path, os.stat_result]:
+    """
+    Valida o tipo, normaliza o caminho e garante que ele existe.
+
+    Args:
+        path (Union[str, Path]): Caminho do arquivo ou diretório.
+
+    Returns:
+        Tuple[Path, os.stat_result]: Caminho normalizado e o resultado do stat.
+
+    Raises:
+        TypeError: Se o caminho não for string ou Path.
+        FileNotFoundError: Se o caminho não existir.
+    """
+
+    if not isinstance(path, (str, Path)):
+        raise TypeError('O caminho deve ser uma string ou Path')
+
+    path = _normalize_path(path)
+    st = _stat_or_none(path)
+
+    if st is None:
+        raise FileNotFoundError(f'O caminho não existe: {path}')
+
+    return path, st
+
+def _is_readonly_posix(path: Union[str, Path], *, fast: bool = False) -> bool:
     """
     Verifica se o caminho é somente leitura (sem permissão de escrita)
 
     Args:
         path (Union[str, Path]): Caminho do arquivo ou diretório.
+        fast (bool): Se True, olha apenas o bit de escrita do dono no st_mode
+                     (sem os.access/ACLs). Mais rápido, porém aproximado.
     
     Returns: 
         bool: True se for somente leitura, False caso contrário.
@@ -71,28 +451,34 @@ def _is_readonly(path: Union[str, Path]) -> bool:
         FileNotFoundError: Se o caminho não existir.
     """
     
-    if not isinstance(path, (str, Path)):
-        raise TypeError('O caminho deve ser uma string ou Path')
+    path, st = _existing_path(path)
 
-    path = Path(path).expanduser().resolve()
-    
-    if not path.exists():
-        raise FileNotFoundError(f'O caminho não existe: {path}')
+    if fast:
+        return not (st.st_mode & stat.S_IWUSR)
 
-    if sys.platform != 'win32':
-        return not os.access(path, os.W_OK)
+    return not os.access(path, os.W_OK)
+
+def _is_readonly_win(path: Union[str, Path], *, fast: bool = False) -> bool:
+    """
+    Versão Windows de _is_readonly(): usa o atributo FILE_ATTRIBUTE_READONLY.
+    Argumentos, retorno e exceções iguais aos de _is_readonly_posix().
+    """
+
+    path, st = _existing_path(path)
+
+    if fast:
+        return not (st.st_mode & stat.S_IWUSR)
 
-    FILE_ATTRIBUTE_READONLY = 0x01 
     try:
-        attrs = ctypes.windll.kernel32.GetFileAttributesW(str(path))
-        if attrs == -1:
+        attrs = _GetFileAttributesW(str(path))
+        if attrs == _INVALID_FILE_ATTRIBUTES:
             raise OSError('Erro ao obter atributos do arquivo')
-        return bool(attrs & FILE_ATTRIBUTE_READONLY)
+        return bool(attrs & _FILE_ATTRIBUTE_READONLY)
     except Exception:
         # Fallback: Tenta com os.access 
         return not os.access(path, os.W_OK)
 
-def _is_hidden(path: Union[str, Path]) -> bool:
+def _is_hidden_posix(path: Union[str, Path]) -> bool:
     """
     Verifica se o caminho aponta para um arquivo ou diretório oculto.
     
@@ -107,30 +493,33 @@ def _is_hidden(path: Union[str, Path]) -> bool:
         FileNotFoundError: Se o caminho não existir.
     """
 
-    if not isinstance(path, (str, Path)):
-        raise TypeError('O caminho deve ser uma string ou Path')
-
-    path = Path(path).expanduser().resolve()
-    
-    if not path.exists():
-        raise FileNotFoundError(f'O caminho não existe: {path}')
+    path, _ = _existing_path(path)
 
     # Unix - Oculto se começar com '.'
-    if sys.platform != 'win32':
-        return path.name.startswith('.')
+    return path.name.startswith('.')
+
+def _is_hidden_win(path: Union[str, Path]) -> bool:
+    """
+    Versão Windows de _is_hidden(): usa o atributo FILE_ATTRIBUTE_HIDDEN.
+    Argumentos, retorno e exceções iguais aos de _is_hidden_posix().
+    """
+
+    path, _ = _existing_path(path)
 
     # Windows - Verifica atributo de arquivo oculto 
-    FILE_ATTRIBUTE_HIDDEN = 0x02 
-    
     try:
-        attrs = ctypes.windll.kernel32.GetFileAttributesW(str(path))
-        if attrs == -1:
+        attrs = _GetFileAttributesW(str(path))
+        if attrs == _INVALID_FILE_ATTRIBUTES:
             raise OSError('Erro ao obter atributos do arquivo.')
-        return bool(attrs & FILE_ATTRIBUTE_HIDDEN)
+        return bool(attrs & _FILE_ATTRIBUTE_HIDDEN)
     except Exception:
         # Fallback: Verifica prefixo no Windows também 
         return path.name.startswith('.')
 
+# A plataforma não muda durante o processo: escolhe a implementação uma vez
+_is_readonly = _is_readonly_win if _IS_WIN else _is_readonly_posix
+_is_hidden = _is_hidden_win if _IS_WIN else _is_hidden_posix
+
 def _get_tempfile(prefix: str = 'tmp_', suffix: str = '.tmp', dir: Optional[Union[str, Path]] = None, close_file: bool = True) -> Path:
     """
     Cria um arquivo temporário com nome único e retorna o caminho. 
@@ -172,7 +561,7 @@ def _get_tempfile(prefix: str = 'tmp_', suffix: str = '.tmp', dir: Optional[Unio
 
 
 
-def _validate_path(path: Union[str, Path], *, must_exist: bool = True, is_file: Optional[bool] = None, readable: bool = False, writable: bool = False, allow_hidden: bool = True) -> Path:
+def _validate_path(path: Union[str, Path], *, must_exist: bool = True, is_file: Optional[bool] = None, readable: bool = False, writable: bool = False, allow_hidden: bool = True, _assume_absolute: bool = False) -> Path:
     """
     Valida um caminho de arquivo ou diretório 
     
@@ -183,6 +572,8 @@ def _validate_path(path: Union[str, Path], *, must_exist: bool = True, is_file:
         readable (bool): Se True, verifica se o caminho é legível. 
         writable (bool): Se True, verifica se o caminho é gravável.
         allow_hidden (bool): Se False, rejeita arquivos/diretórios ocultos (prefixados com '.').
+        _assume_absolute (bool): Uso interno. Se True, `path` já é um Path absoluto
+                                 e normalizado, e a normalização é pulada.
     
     Returns:
         Path: O caminho balidado, convertido para objeto Path.
@@ -195,15 +586,17 @@ def _validate_path(path: Union[str, Path], *, must_exist: bool = True, is_file:
     if not isinstance(path, (str, Path)):
         raise TypeError('O caminho deve ser uma string ou caminho')
 
-    path = Path(path).expanduser().resolve()
+    if not _assume_absolute:
+        path = _normalize_path(path)
+    st = _stat_or_none(path)
     
-    if must_exist and not path.exists():
+    if must_exist and st is None:
         raise PathValidationError(str(path), 'O caminho não existe')
 
     if is_file is not None:
-        if is_file and not path.is_file():
+        if is_file and not (st is not None and stat.S_ISREG(st.st_mode)):
             raise PathValidationError(str(path), 'Esperado arquivo, mas não é.')
-        elif not is_file and not path.is_dir():
+        elif not is_file and not (st is not None and stat.S_ISDIR(st.st_mode)):
             raise PathValidationError(str(path), 'Esperado diretório, mas não é.')
     
     if not allow_hidden and path.name.startswith('.'):
@@ -219,7 +612,7 @@ def _validate_path(path: Union[str, Path], *, must_exist: bool = True, is_file:
     
     return path 
 
-def _ensure_directory(directory: Union[str, Path], *, create_if_missing: bool = True, exist_ok: bool = True) -> Path:
+def _ensure_directory(directory: Union[str, Path], *, create_if_missing: bool = True, exist_ok: bool = True, _assume_absolute: bool = False) -> Path:
     """
     Garante que um diretório existe. Se não existir, tenta criá-lo
    
@@ -227,6 +620,8 @@ def _ensure_directory(directory: Union[str, Path], *, create_if_missing: bool =
         directory (Union[str, Path]): Caminho do diretório.
         create_if_missing (bool): Se True, cria o diretório caso não exista.
         exist_ok (bool): Se False, levanta erro se o diretório já existir.
+        _assume_absolute (bool): Uso interno. Se True, `directory` já é um Path
+                                 absoluto e normalizado, e a normalização é pulada.
     
     Returns:
         Path: Objeto Path do diretório validado ou criado.
@@ -239,10 +634,12 @@ def _ensure_directory(directory: Union[str, Path], *, create_if_missing: bool =
     if not isinstance(directory, (str, Path)):
         raise TypeError('O diretório deve ser uma string ou Path')
 
-    directory = Path(directory).expanduser().resolve()
+    if not _assume_absolute:
+        directory = _normalize_path(directory)
+    st = _stat_or_none(directory)
 
-    if directory.exists():
-        if not directory.is_dir():
+    if st is not None:
+        if not stat.S_ISDIR(st.st_mode):
             raise PathValidationError(str(directory), 'O caminho existe, mas não é um diretório')
         if not exist_ok:
             raise PathValidationError(str(directory), 'O diretório já existe')
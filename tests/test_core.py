@@ -22,17 +22,35 @@ def test_create_file_with_dict(tmp_path):
     loaded = json.loads(path.read_text(encoding = 'utf-8'))
     assert loaded == data
 
+def test_create_file_large_content(tmp_path):
+    path = tmp_path / 'grande.txt'
+    text = 'Conteúdo ✔ ' * 300_000
+    create_file(path, text)
+    assert path.read_text(encoding = 'utf-8') == text
+
 def test_create_file_overwrite_false(tmp_path):
     path = tmp_path / 'fixo.txt'
     path.write_text('original')
     with pytest.raises(PathValidationError):
         create_file(path, 'novo', overwrite = False)
+    assert path.read_text() == 'original'
+
+def test_create_file_overwrite_false_new_file(tmp_path):
+    path = tmp_path / 'novo.txt'
+    create_file(path, 'novo', overwrite = False)
+    assert path.read_text(encoding = 'utf-8') == 'novo'
 
 def test_create_file_invalid_content(tmp_path):
     path = tmp_path / 'invalido.txt'
     with pytest.raises(TypeError):
         create_file(path, object())
 
+def test_create_file_encoding_error(tmp_path):
+    path = tmp_path / 'novo_dir' / 'ascii.txt'
+    with pytest.raises(UnicodeEncodeError):
+        create_file(path, 'Conteúdo', encoding = 'ascii')
+    assert not path.parent.exists()
+
 ### ----------- read_file() ----------- ###
 
 def test_read_file_text(tmp_path):
@@ -49,6 +67,28 @@ def test_read_file_bytes(tmp_path):
     result = read_file(path, as_bytes = True)
     assert result == data
 
+def test_read_file_text_newlines(tmp_path):
+    path = tmp_path / 'quebras.txt'
+    path.write_bytes('Linha 1\r\nLinha 2\rFim ✔'.encode('utf-8'))
+    result = read_file(path)
+    assert result == path.read_text(encoding = 'utf-8')
+
+def test_read_file_decode_error(tmp_path):
+    path = tmp_path / 'latin1.txt'
+    path.write_bytes('Conteúdo'.encode('latin-1'))
+    with pytest.raises(UnicodeDecodeError):
+        read_file(path)
+
+def test_read_file_symlink_parent(tmp_path):
+    (tmp_path / 'real' / 'sub').mkdir(parents = True)
+    (tmp_path / 'real' / 'x.txt').write_text('real')
+    (tmp_path / 'x.txt').write_text('falso')
+    (tmp_path / 'link').symlink_to(tmp_path / 'real' / 'sub', target_is_directory = True)
+    path = tmp_path / 'link' / '..' / 'x.txt'
+    with open(path, encoding = 'utf-8') as handle:
+        expected = handle.read()
+    assert read_file(path) == expected == 'real'
+
 def test_read_file_inexistente(tmp_path):
     path = tmp_path / 'nada.txt'
     with pytest.raises(PathValidationError):
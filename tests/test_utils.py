@@ -1,14 +1,17 @@
 import pytest, shutil, tempfile
-import ctypes, stat, os
+import ctypes, stat, os, json
+from datetime import date
 from pathlib import Path
+from collections import OrderedDict
 
 from filerix.utils import (
     _validate_path, _ensure_directory,
     _get_tempfile, _is_hidden, _is_readonly,
-    _sanitize_content
+    _sanitize_content, _STRIP_TABLE, _STRIP_CACHE_MAX
 )
 
 from filerix.exceptions import PathValidationError
+import filerix.utils
 
 ### ----------- _validate_path() ----------- ###
 
@@ -18,6 +21,29 @@ def test_validate_existing_file(tmp_path):
     result = _validate_path(file, must_exist = True, is_file = True)
     assert result == file.resolve() 
 
+def test_validate_normalizes_path(tmp_path):
+    file = tmp_path / 'file.txt'
+    file.write_text('Teste')
+    (tmp_path / 'sub').mkdir()
+    result = _validate_path(tmp_path / 'sub' / '..' / 'file.txt')
+    assert result == file
+
+def test_validate_symlink_parent(tmp_path):
+    (tmp_path / 'real' / 'sub').mkdir(parents = True)
+    target = tmp_path / 'real' / 'x.txt'
+    target.write_text('real')
+    (tmp_path / 'x.txt').write_text('falso')
+    (tmp_path / 'link').symlink_to(tmp_path / 'real' / 'sub', target_is_directory = True)
+    result = _validate_path(tmp_path / 'link' / '..' / 'x.txt')
+    assert result == target.resolve()
+
+def test_validate_expected_directory(tmp_path):
+    file = tmp_path / 'file.txt'
+    file.write_text('Teste')
+    assert _validate_path(tmp_path, is_file = False) == tmp_path
+    with pytest.raises(PathValidationError):
+        _validate_path(file, is_file = False)
+
 def test_validate_nonexistent_path():
     with pytest.raises(PathValidationError):
         _validate_path('não-existe.txt')
@@ -100,6 +126,13 @@ def test_is_readonly_false(tmp_path):
     file.write_text('Pode escrever')
     assert _is_readonly(file) is False 
 
+def test_is_readonly_fast(tmp_path):
+    file = tmp_path / 'ro_fast.txt'
+    file.write_text('Apenas leitura')
+    assert _is_readonly(file, fast = True) is False
+    file.chmod(stat.S_IREAD)
+    assert _is_readonly(file, fast = True) is True
+
 ### ----------- _sanitize_content() ----------- ###
 
 def test_sanitize_str():
@@ -107,11 +140,71 @@ def test_sanitize_str():
     result = _sanitize_content(text)
     assert 'Linh\nNova' in result 
 
+def test_sanitize_strip_table_bounded():
+    text = ''.join(chr(c) for c in range(0x110000))
+    _sanitize_content(text)
+    assert len(_STRIP_TABLE) <= _STRIP_CACHE_MAX
+
+def test_sanitize_strip_table_caches_non_latin():
+    text = '中文文本，日本語のテキスト，한국어 텍스트 😀'
+    assert _sanitize_content(text) == text
+    assert all(ord(ch) in _STRIP_TABLE for ch in text)
+
+def test_sanitize_line_endings():
+    text = 'a\r\nb\rc\nd'
+    result = _sanitize_content(text)
+    assert result == 'a\nb\nc\nd'
+
+def test_sanitize_control_chars():
+    text = 'Olá\x00 mundo\x07\u200b ✔\tfim'
+    result = _sanitize_content(text)
+    assert result == 'Olá mundo ✔\tfim'
+
+def test_sanitize_large_ascii():
+    clean = 'Linha com\ttab\n' * 200
+    assert _sanitize_content(clean) == clean
+    dirty = clean + 'fim\r\n\x00'
+    assert _sanitize_content(dirty) == clean + 'fim\n'
+
 def test_sanitize_dict():
     data = {'Nome': 'Alecsander', 'Idade': 18}
     result = _sanitize_content(data)
     assert '"Nome": "Alecsander"' in result 
 
+def test_sanitize_dict_compact():
+    data = {'Nome': 'Alecsander', 'Idade': 18}
+    result = _sanitize_content(data, compact = True)
+    assert result == '{"Nome":"Alecsander","Idade":18}'
+
+def test_sanitize_dict_non_str_keys():
+    result = _sanitize_content({1: 'um'})
+    assert '"1": "um"' in result
+
+def test_sanitize_dict_floats_match_json():
+    data = {'a': 1e16, 'b': 1e-07, 'c': 1.5e-05, 'd': 0.5, 'nan': float('nan'), 'inf': float('-inf')}
+    assert _sanitize_content(data) == json.dumps(data, ensure_ascii = False, indent = 2)
+    compact = json.dumps(data, ensure_ascii = False, separators = (',', ':'))
+    assert _sanitize_content(data, compact = True) == compact
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_sanitize_dict_unsupported_value(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(filerix.utils, 'orjson', None)
+    with pytest.raises(TypeError):
+        _sanitize_content({'data': date(2024, 1, 1)})
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_sanitize_circular_reference(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(filerix.utils, 'orjson', None)
+    circular_list = []
+    circular_list.append(circular_list)
+    circular_dict = {}
+    circular_dict['x'] = circular_dict
+    for data in (circular_list, circular_dict):
+        with pytest.raises(TypeError):
+            _sanitize_content(data)
+
 def test_sanitize_bytes():
     b = b'Isso \xe2\x9c\x94'
     result = _sanitize_content(b)
@@ -123,6 +216,19 @@ def test_sanitize_compact():
     assert '\n\n' not in result 
     assert '  ' not in result 
 
+def test_sanitize_compact_tabs():
+    text = 'a\tb \t c d'
+    result = _sanitize_content(text, compact = True)
+    assert result == 'a b c d'
+
+def test_sanitize_subclass():
+    result = _sanitize_content(OrderedDict(a = 1), compact = True)
+    assert result == '{"a":1}'
+
+def test_sanitize_empty_after_cleanup():
+    with pytest.raises(ValueError):
+        _sanitize_content(' \x00\t\r\n ')
+
 def test_sanitize_unsupported_type():
     with pytest.raises(TypeError):
         _sanitize_content(object())